@@ -7,31 +7,55 @@ Now includes real database authentication.
 """
 
 import flet as ft
-from database import get_session
+from database import get_session, close_session
 from models import User
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.exc import IntegrityError
 
 
-def show_snackbar(page: ft.Page, message: str, is_error: bool = False):
-    """Helper function to show snackbar notifications"""
-    snackbar = ft.SnackBar(
-        content=ft.Text(message),
-        bgcolor=ft.Colors.RED_700 if is_error else ft.Colors.GREEN_700,
-    )
-    snackbar.open = True
-    page.overlay.append(snackbar)
-    page.update()
+# Colors resolved once at import instead of on every view construction
+_RED_700 = ft.Colors.RED_700
+_GREEN_700 = ft.Colors.GREEN_700
+_BLUE_400 = ft.Colors.BLUE_400
+_BLUE_700 = ft.Colors.BLUE_700
+_WHITE = ft.Colors.WHITE
+_GREY_700 = ft.Colors.GREY_700
+_BLUE_GREY_100 = ft.Colors.BLUE_GREY_100
+_BLUE_50 = ft.Colors.BLUE_50
+
+# Minimum accepted password length at signup
+MIN_PASSWORD_LENGTH = 6
+
+# Hot-path statements built once at import; SQLAlchemy's compiled cache then
+# reuses the compiled SQL across calls instead of rebuilding the query each time
+LOGIN_STMT = select(User).where(User.username == bindparam("username"))
+SIGNUP_TAKEN_STMT = select(
+    exists().where(User.username == bindparam("username")),
+    exists().where(User.email == bindparam("email")),
+)
+
+
+def validate_signup(username, email, password, confirm_password):
+    """Validate signup form values, returns an error message or None"""
+    # Short-circuiting checks - no temporary list for all(), cheapest test first
+    if not (username and email and password and confirm_password):
+        return "Please fill in all fields"
+    if password != confirm_password:
+        return "Passwords do not match"
+    if len(password) < MIN_PASSWORD_LENGTH:
+        return f"Password must be at least {MIN_PASSWORD_LENGTH} characters"
+    return None
 
 
 def show_snackbar(page: ft.Page, message: str, is_error: bool = False):
-    """Helper function to show snackbars"""
+    """Helper function to show snackbar notifications"""
     snackbar = ft.SnackBar(
         content=ft.Text(message),
-        bgcolor=ft.Colors.RED_700 if is_error else ft.Colors.GREEN_700,
+        bgcolor=_RED_700 if is_error else _GREEN_700,
     )
-    page.overlay.append(snackbar)
-    snackbar.open = True
-    page.update()
+    # Patches only the page's dialog stack instead of re-diffing the whole page,
+    # and drops the snackbar from the stack once it is dismissed
+    page.show_dialog(snackbar)
 
 
 class LoginView(ft.Container):
@@ -48,8 +72,8 @@ class LoginView(ft.Container):
         self.username_field = ft.TextField(
             label="Username",
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Password input field
@@ -58,16 +82,16 @@ class LoginView(ft.Container):
             password=True,
             can_reveal_password=True,
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Login button
         self.login_button = ft.ElevatedButton(
             content=ft.Text("Login"),
             width=300,
-            bgcolor=ft.Colors.BLUE_700,
-            color=ft.Colors.WHITE,
+            bgcolor=_BLUE_700,
+            color=_WHITE,
             on_click=self.handle_login,
         )
         
@@ -91,12 +115,12 @@ class LoginView(ft.Container):
                 "Welcome Back",
                 size=32,
                 weight=ft.FontWeight.BOLD,
-                color=ft.Colors.BLUE_700,
+                color=_BLUE_700,
             ),
             ft.Text(
                 "Login to your account",
                 size=16,
-                color=ft.Colors.GREY_700,
+                color=_GREY_700,
             ),
             ft.Container(height=20),  # Spacer
             self.username_field,
@@ -122,12 +146,12 @@ class LoginView(ft.Container):
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=40,
-            bgcolor=ft.Colors.WHITE,
+            bgcolor=_WHITE,
             border_radius=10,
             shadow=ft.BoxShadow(
                 spread_radius=1,
                 blur_radius=15,
-                color=ft.Colors.BLUE_GREY_100,
+                color=_BLUE_GREY_100,
                 offset=ft.Offset(0, 0),
             ),
         )
@@ -135,7 +159,13 @@ class LoginView(ft.Container):
         # Configure container properties
         self.alignment = ft.Alignment.CENTER
         self.expand = True
-        self.bgcolor = ft.Colors.BLUE_50
+        self.bgcolor = _BLUE_50
+    
+    def reset(self):
+        """Clear the form so the view can be shown again"""
+        self.username_field.value = ""
+        self.password_field.value = ""
+        self.login_button.disabled = False
     
     def handle_login(self, e):
         """Handle login button click with real database authentication"""
@@ -147,24 +177,50 @@ class LoginView(ft.Container):
             show_snackbar(self.app_page, "Please fill in all fields", is_error=True)
             return
         
-        # Authenticate user
+        # Disable the button while in flight to prevent double-submits
+        self.login_button.disabled = True
+        self.login_button.update()
+        
+        # Password hashing is CPU-bound - run it on a worker thread so the UI stays responsive
+        self.app_page.run_thread(
+            lambda: self._finish_login(username, *self._authenticate(username, password))
+        )
+    
+    def _authenticate(self, username, password):
+        """Check credentials against the database, returns (user, error message)"""
         session = get_session()
         try:
-            user = session.query(User).filter_by(username=username).first()
+            user = session.execute(LOGIN_STMT, {"username": username}).scalar_one_or_none()
             
             if user and user.check_password(password):
-                # Login successful
-                show_snackbar(self.app_page, f"Welcome back, {username}!")
-                # Call success callback with user object
-                if self.on_login_success:
-                    self.on_login_success(user)
-            else:
-                # Invalid credentials
-                show_snackbar(self.app_page, "Invalid username or password", is_error=True)
+                # Transparently upgrade legacy bcrypt hashes now that we have the plaintext
+                if user.needs_rehash():
+                    user.set_password(password)
+                    session.commit()
+                    session.refresh(user)
+                return user, None
+            return None, "Invalid username or password"
         except Exception as ex:
-            show_snackbar(self.app_page, f"Login error: {str(ex)}", is_error=True)
+            session.rollback()
+            return None, f"Login error: {str(ex)}"
         finally:
-            session.close()
+            # Release this thread's scoped session rather than leaving a closed one registered
+            close_session()
+    
+    def _finish_login(self, username, user, error):
+        """Show the authentication result and re-enable the login button"""
+        self.login_button.disabled = False
+        
+        if error:
+            self.login_button.update()
+            show_snackbar(self.app_page, error, is_error=True)
+            return
+        
+        # Login successful
+        show_snackbar(self.app_page, f"Welcome back, {username}!")
+        # Call success callback with user object
+        if self.on_login_success:
+            self.on_login_success(user)
 
 
 class SignupView(ft.Container):
@@ -179,16 +235,16 @@ class SignupView(ft.Container):
         self.username_field = ft.TextField(
             label="Username",
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Email input field
         self.email_field = ft.TextField(
             label="Email",
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Password input field
@@ -197,8 +253,8 @@ class SignupView(ft.Container):
             password=True,
             can_reveal_password=True,
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Confirm password input field
@@ -207,16 +263,16 @@ class SignupView(ft.Container):
             password=True,
             can_reveal_password=True,
             width=300,
-            border_color=ft.Colors.BLUE_400,
-            focused_border_color=ft.Colors.BLUE_700,
+            border_color=_BLUE_400,
+            focused_border_color=_BLUE_700,
         )
         
         # Signup button
         self.signup_button = ft.ElevatedButton(
             content=ft.Text("Sign Up"),
             width=300,
-            bgcolor=ft.Colors.BLUE_700,
-            color=ft.Colors.WHITE,
+            bgcolor=_BLUE_700,
+            color=_WHITE,
             on_click=self.handle_signup,
         )
         
@@ -234,12 +290,12 @@ class SignupView(ft.Container):
                         "Create Account",
                         size=32,
                         weight=ft.FontWeight.BOLD,
-                        color=ft.Colors.BLUE_700,
+                        color=_BLUE_700,
                     ),
                     ft.Text(
                         "Sign up to get started",
                         size=16,
-                        color=ft.Colors.GREY_700,
+                        color=_GREY_700,
                     ),
                     ft.Container(height=20),  # Spacer
                     self.username_field,
@@ -257,12 +313,12 @@ class SignupView(ft.Container):
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=40,
-            bgcolor=ft.Colors.WHITE,
+            bgcolor=_WHITE,
             border_radius=10,
             shadow=ft.BoxShadow(
                 spread_radius=1,
                 blur_radius=15,
-                color=ft.Colors.BLUE_GREY_100,
+                color=_BLUE_GREY_100,
                 offset=ft.Offset(0, 0),
             ),
         )
@@ -270,7 +326,15 @@ class SignupView(ft.Container):
         # Configure container properties
         self.alignment = ft.Alignment.CENTER
         self.expand = True
-        self.bgcolor = ft.Colors.BLUE_50
+        self.bgcolor = _BLUE_50
+    
+    def reset(self):
+        """Clear the form so the view can be shown again"""
+        self.username_field.value = ""
+        self.email_field.value = ""
+        self.password_field.value = ""
+        self.confirm_password_field.value = ""
+        self.signup_button.disabled = False
     
     def handle_signup(self, e):
         """Handle signup button click with real database storage"""
@@ -280,34 +344,33 @@ class SignupView(ft.Container):
         confirm_password = self.confirm_password_field.value
         
         # Validate input
-        if not all([username, email, password, confirm_password]):
-            show_snackbar(self.app_page, "Please fill in all fields", is_error=True)
+        error = validate_signup(username, email, password, confirm_password)
+        if error:
+            show_snackbar(self.app_page, error, is_error=True)
             return
         
-        # Check password match
-        if password != confirm_password:
-            show_snackbar(self.app_page, "Passwords do not match", is_error=True)
-            return
+        # Disable the button while in flight to prevent double-submits
+        self.signup_button.disabled = True
+        self.signup_button.update()
         
-        # Validate password strength (minimum 6 characters)
-        if len(password) < 6:
-            show_snackbar(self.app_page, "Password must be at least 6 characters", is_error=True)
-            return
-        
-        # Create new user in database
+        # Password hashing is CPU-bound - run it on a worker thread so the UI stays responsive
+        self.app_page.run_thread(
+            lambda: self._finish_signup(self._register(username, email, password))
+        )
+    
+    def _register(self, username, email, password):
+        """Create the user in the database, returns an error message or None"""
         session = get_session()
         try:
-            # Check if username or email already exists
-            existing_user = session.query(User).filter(
-                (User.username == username) | (User.email == email)
-            ).first()
+            # Check if username or email already exists (one round-trip, no row hydration)
+            username_taken, email_taken = session.execute(
+                SIGNUP_TAKEN_STMT, {"username": username, "email": email}
+            ).one()
             
-            if existing_user:
-                if existing_user.username == username:
-                    show_snackbar(self.app_page, "Username already exists", is_error=True)
-                else:
-                    show_snackbar(self.app_page, "Email already exists", is_error=True)
-                return
+            if username_taken:
+                return "Username already exists"
+            if email_taken:
+                return "Email already exists"
             
             # Create new user
             new_user = User(username=username, email=email)
@@ -315,25 +378,35 @@ class SignupView(ft.Container):
             
             session.add(new_user)
             session.commit()
-            
-            # Success - show message and switch to login
-            show_snackbar(self.app_page, "Account created successfully! Please login.")
-            
-            # Clear fields
-            self.username_field.value = ""
-            self.email_field.value = ""
-            self.password_field.value = ""
-            self.confirm_password_field.value = ""
-            self.app_page.update()
-            
-            # Switch to login screen after a brief moment
-            self.on_switch_to_login()
-            
+            return None
         except IntegrityError:
             session.rollback()
-            show_snackbar(self.app_page, "Username or email already exists", is_error=True)
+            return "Username or email already exists"
         except Exception as ex:
             session.rollback()
-            show_snackbar(self.app_page, f"Signup error: {str(ex)}", is_error=True)
+            return f"Signup error: {str(ex)}"
         finally:
-            session.close()
+            # Release this thread's scoped session rather than leaving a closed one registered
+            close_session()
+    
+    def _finish_signup(self, error):
+        """Show the signup result and re-enable the signup button"""
+        self.signup_button.disabled = False
+        
+        if error:
+            self.signup_button.update()
+            show_snackbar(self.app_page, error, is_error=True)
+            return
+        
+        # Success - show message and switch to login
+        show_snackbar(self.app_page, "Account created successfully! Please login.")
+        
+        # Clear fields
+        self.username_field.value = ""
+        self.email_field.value = ""
+        self.password_field.value = ""
+        self.confirm_password_field.value = ""
+        self.app_page.update()
+        
+        # Switch to login screen after a brief moment
+        self.on_switch_to_login()
@@ -1,7 +1,20 @@
 import flet as ft
+from collections import OrderedDict
 from ui.boards import BoardSidebar, BoardView
 
 
+# Colors resolved once at import instead of on every view construction
+_WHITE = ft.Colors.WHITE
+_RED_700 = ft.Colors.RED_700
+_BLUE_700 = ft.Colors.BLUE_700
+
+# Most board views kept built for logged-in users; older ones are rebuilt from the
+# database when selected again. Guest views hold the only copy of their tasks and
+# are never evicted. Each cached view has its own session, so this stays well below
+# the engine's connection pool limit (5 + 10 overflow).
+BOARD_VIEW_CACHE_SIZE = 8
+
+
 class DashboardView(ft.Container):
     """Dashboard view with boards functionality"""
     
@@ -21,30 +34,35 @@ class DashboardView(ft.Container):
                         "Tusday.com",
                         size=24,
                         weight=ft.FontWeight.BOLD,
-                        color=ft.Colors.WHITE,
+                        color=_WHITE,
                     ),
                     ft.Container(expand=True),  # Spacer
                     ft.Text(
                         f"👤 {user.username}" + (" (Guest)" if is_guest else ""),
                         size=16,
-                        color=ft.Colors.WHITE,
+                        color=_WHITE,
                     ),
                     ft.Container(width=20),
                     ft.ElevatedButton(
                         content=ft.Text("Logout" if not is_guest else "Exit Guest"),
-                        bgcolor=ft.Colors.RED_700,
-                        color=ft.Colors.WHITE,
-                        on_click=lambda e: self.on_logout(),
+                        bgcolor=_RED_700,
+                        color=_WHITE,
+                        on_click=self.handle_logout,
                     ),
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             ),
             padding=20,
-            bgcolor=ft.Colors.BLUE_700,
+            bgcolor=_BLUE_700,
         )
         
         # Create board view (initially empty)
-        self.board_view = BoardView(page, None)
+        self.empty_board_view = BoardView(page, None)
+        self.board_view = self.empty_board_view
+        
+        # Built board views keyed by board id, least recently shown first -
+        # re-selecting a board reuses its view
+        self._board_views = OrderedDict()
         
         # Create sidebar with guest mode support
         self.sidebar = BoardSidebar(
@@ -53,6 +71,7 @@ class DashboardView(ft.Container):
             on_board_select=self.handle_board_select,
             on_refresh=self.refresh_board_view,
             is_guest=is_guest,
+            on_board_delete=self.handle_board_delete,
         )
         
         # Build main layout with sidebar and content
@@ -77,18 +96,57 @@ class DashboardView(ft.Container):
         
         self.expand = True
     
+    def handle_logout(self, e):
+        """Release the sidebar's and board views' resources and log out"""
+        self.sidebar.dispose()
+        for board_view in self._board_views.values():
+            board_view.dispose()
+        self._board_views.clear()
+        self.on_logout()
+    
     def handle_board_select(self, board):
         """Handle board selection from sidebar"""
         self.current_board = board
         self.refresh_board_view()
     
+    def handle_board_delete(self, board):
+        """Drop the cached view of a deleted board"""
+        board_view = self._board_views.pop(board.id, None)
+        if board_view:
+            # Its rows are already gone, so unsaved edits are dropped rather than written
+            board_view.dispose(flush=False)
+        if self.current_board and self.current_board.id == board.id:
+            self.current_board = None
+    
     def refresh_board_view(self):
         """Refresh the board view content"""
         # Find the row containing sidebar and board view
         main_row = self.content.controls[1].content
+        board = self.current_board
+        if board is not None:
+            # Board rows are immutable snapshots - take the sidebar's latest one so
+            # a rename shows up in the title
+            board = self.current_board = self.sidebar.get_board(board.id) or board
+        
+        if board is None:
+            self.board_view = self.empty_board_view
+        elif board.id in self._board_views:
+            # Reuse the already-built view, only picking up metadata changes
+            self._board_views.move_to_end(board.id)
+            self.board_view = self._board_views[board.id]
+            self.board_view.set_board(board)
+        else:
+            self.board_view = BoardView(
+                self.app_page,
+                board,
+                is_guest=self.is_guest,
+                on_tasks_change=self.sidebar.refresh_boards,
+            )
+            self._board_views[board.id] = self.board_view
+            if not self.is_guest and len(self._board_views) > BOARD_VIEW_CACHE_SIZE:
+                self._board_views.popitem(last=False)[1].dispose()
         
-        # Replace board view with is_guest parameter
-        self.board_view = BoardView(self.app_page, self.current_board, is_guest=self.is_guest)
         main_row.controls[1] = self.board_view
         
-        self.app_page.update()
+        # Patch only the sidebar/board row instead of the whole page
+        main_row.update()
@@ -1,14 +1,56 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
-from models import Base
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker, scoped_session, joinedload, selectinload, load_only
+from sqlalchemy.pool import QueuePool
+from models import Base, Board, Task, TaskCell
+import atexit
+import logging
 import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Database file location - the TUSDAY_DB environment variable overrides it,
+# ":memory:" gives a throwaway database that is deleted on exit (e.g. for tests)
+DATABASE_FILE = os.environ.get("TUSDAY_DB", "monday_app.db")
+
+if DATABASE_FILE == ":memory:":
+    # A temporary file rather than SQLite's in-memory database, whose shared cache
+    # fails concurrent sessions with SQLITE_LOCKED instead of letting WAL handle them
+    _temp_dir = tempfile.mkdtemp(prefix="tusday-")
+    atexit.register(shutil.rmtree, _temp_dir, ignore_errors=True)
+    DATABASE_FILE = os.path.join(_temp_dir, "tusday.db")
 
-# Database file location
-DATABASE_FILE = "monday_app.db"
 DATABASE_URL = f"sqlite:///{DATABASE_FILE}"
 
-# Create engine
-engine = create_engine(DATABASE_URL, echo=False)
+# Stored in SQLite's user_version pragma - bump whenever tables or indexes change
+# so existing databases are brought up to date once instead of on every launch
+SCHEMA_VERSION = 3
+
+# Set once init_database() has run in this process
+_INITIALIZED = False
+
+# Create engine - pooled connections that may be shared across Flet's handler threads
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    future=True,
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so readers don't block on writers and commits skip the full fsync"""
+    cursor = dbapi_connection.cursor()
+    # SQLite only enforces foreign keys (and their ON DELETE CASCADE) when asked to
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -18,9 +60,72 @@ Session = scoped_session(SessionLocal)
 
 
 def init_database():
-    """Initialize the database - create all tables"""
-    Base.metadata.create_all(bind=engine)
-    print(f"Database initialized: {DATABASE_FILE}")
+    """Initialize the database - create all tables on first run or after a schema change"""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    
+    if version < SCHEMA_VERSION:
+        with engine.connect() as conn:
+            # pysqlite doesn't open a transaction before DDL on its own, so without
+            # this every CREATE would autocommit (and fsync) separately
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            Base.metadata.create_all(conn)
+            _upgrade_schema(conn, version)
+            
+            # create_all skips tables that already exist, so add any indexes that
+            # databases created before they were declared are missing
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+            
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        logger.info("Database initialized: %s", DATABASE_FILE)
+    
+    _INITIALIZED = True
+
+
+def _upgrade_schema(conn, version):
+    """Migrate data in databases created by older schema versions"""
+    if version < 2:
+        # task_cells became unique per (task_id, column_id) - keep the newest duplicate
+        # so the unique index can be built, and drop the non-unique index it replaces
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_task_cells_task_column")
+        conn.exec_driver_sql(
+            "DELETE FROM task_cells WHERE id NOT IN "
+            "(SELECT MAX(id) FROM task_cells GROUP BY task_id, column_id)"
+        )
+    
+    if version < 3:
+        # task_cells foreign keys gained ON DELETE CASCADE. SQLite can't alter a
+        # foreign key, so tables created without it are rebuilt.
+        on_delete = [row[6] for row in conn.exec_driver_sql("PRAGMA foreign_key_list(task_cells)")]
+        if any(action != "CASCADE" for action in on_delete):
+            _rebuild_task_cells(conn)
+
+
+def _rebuild_task_cells(conn):
+    """Recreate task_cells from the current model, keeping its rows"""
+    # Cells of deleted columns were never removed - they'd now break the foreign key
+    conn.exec_driver_sql(
+        "DELETE FROM task_cells WHERE task_id NOT IN (SELECT id FROM tasks) "
+        "OR column_id NOT IN (SELECT id FROM board_columns)"
+    )
+    
+    # The indexes go first so the new table can create them under the same names
+    for index in TaskCell.__table__.indexes:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    conn.exec_driver_sql("ALTER TABLE task_cells RENAME TO task_cells_old")
+    TaskCell.__table__.create(conn)
+    conn.exec_driver_sql(
+        "INSERT INTO task_cells (id, task_id, column_id, value, created_at) "
+        "SELECT id, task_id, column_id, value, created_at FROM task_cells_old"
+    )
+    conn.exec_driver_sql("DROP TABLE task_cells_old")
 
 
 def get_session():
@@ -31,3 +136,23 @@ def get_session():
 def close_session():
     """Close the current session"""
     Session.remove()
+
+
+def load_board(session, board_id):
+    """Load a board with its columns, tasks and task cells in three queries, or None if it doesn't exist"""
+    return session.execute(
+        select(Board)
+        .options(
+            # Only one board is selected, so its few columns are joined onto that
+            # row instead of costing a query of their own
+            joinedload(Board.columns),
+            selectinload(Board.tasks).options(
+                load_only(Task.id, Task.name, Task.position),
+                selectinload(Task.cells),
+            ),
+        )
+        .where(Board.id == board_id)
+        # Overwrite objects the session already holds, so a long-lived session
+        # sees rows and collections changed since they were first loaded
+        .execution_options(populate_existing=True)
+    ).unique().scalar_one_or_none()
@@ -1,11 +1,21 @@
 import flet as ft
 from auth import LoginView, SignupView
 from dashboard import DashboardView
-from database import init_database
+from database import init_database, close_session
 from models import User
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
+@dataclass(slots=True)
+class GuestUser:
+    """Stand-in user for guest mode - never stored in the database"""
+    username: str = "Guest"
+    email: str = "guest@example.com"
+    id: int | None = None  # No database ID for guest
+    created_at: datetime = field(default_factory=datetime.now)
+
+
 def main(page: ft.Page):
     """Main application entry point"""
     
@@ -22,28 +32,48 @@ def main(page: ft.Page):
     # Store current user
     current_user = None
     
+    # Auth views are built on first use and reused across login/logout cycles
+    login_view = None
+    signup_view = None
+    
     # Navigation functions
     def show_login():
         """Switch to login view"""
+        nonlocal login_view
+        # View transition - drop the scoped session used by the previous screen
+        close_session()
+        
+        if login_view is None:
+            login_view = LoginView(
+                page, 
+                on_switch_to_signup=show_signup,
+                on_login_success=show_dashboard,
+                on_guest_mode=show_guest_dashboard
+            )
+        else:
+            login_view.reset()
+        
         page.controls.clear()
-        page.add(LoginView(
-            page, 
-            on_switch_to_signup=show_signup,
-            on_login_success=show_dashboard,
-            on_guest_mode=show_guest_dashboard
-        ))
+        page.add(login_view)
         page.update()
     
     def show_signup():
         """Switch to signup view"""
+        nonlocal signup_view
+        if signup_view is None:
+            signup_view = SignupView(page, on_switch_to_login=show_login)
+        else:
+            signup_view.reset()
+        
         page.controls.clear()
-        page.add(SignupView(page, on_switch_to_login=show_login))
+        page.add(signup_view)
         page.update()
     
     def show_dashboard(user):
         """Switch to dashboard view after successful login"""
         nonlocal current_user
         current_user = user
+        close_session()
         page.controls.clear()
         page.add(DashboardView(page, user, on_logout=show_login))
         page.update()
@@ -51,12 +81,7 @@ def main(page: ft.Page):
     def show_guest_dashboard():
         """Switch to dashboard in guest mode"""
         # Create a temporary guest user object
-        guest_user = type('GuestUser', (), {
-            'username': 'Guest',
-            'email': 'guest@example.com',
-            'created_at': datetime.now(),
-            'id': None  # No database ID for guest
-        })()
+        guest_user = GuestUser()
         
         page.controls.clear()
         page.add(DashboardView(page, guest_user, on_logout=show_login, is_guest=True))
@@ -5,14 +5,39 @@ SQLAlchemy models for the Tusday.com app.
 Defines User, Board, Column, and Task table structures.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
-from passlib.hash import bcrypt
+from collections import OrderedDict
+from passlib.context import CryptContext
+from passlib.hash import argon2
+import hashlib
 
 Base = declarative_base()
 
+# New hashes use argon2id when its optional argon2-cffi backend is installed.
+# Otherwise fall back to bcrypt_sha256, which pre-hashes with SHA-256 so bcrypt
+# always gets a fixed-size input instead of silently truncating at 72 bytes.
+PASSWORD_SCHEME = "argon2" if argon2.has_backend() else "bcrypt_sha256"
+
+# Built once at import - all hashing/verification goes through this context.
+# Hashes from other schemes (e.g. plain bcrypt from older accounts) still verify
+# and are flagged by needs_rehash() so they get upgraded on next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt_sha256", "bcrypt"],
+    default=PASSWORD_SCHEME,
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
+
+# Small LRU of successful verifications keyed by (password_hash, sha256(password))
+# so repeated logins skip the KDF. Plaintext never sits in the cache.
+VERIFY_CACHE_SIZE = 128
+_verify_cache = OrderedDict()
+
 
 class User(Base):
     """User model for authentication"""
@@ -30,11 +55,27 @@ class User(Base):
     
     def set_password(self, password):
         """Hash and store the password"""
-        self.password_hash = bcrypt.hash(password)
+        self.password_hash = pwd_context.hash(password)
+        _verify_cache.clear()
     
     def check_password(self, password):
-        """Verify a password against the hash"""
-        return bcrypt.verify(password, self.password_hash)
+        """Verify a password against the hash, memoizing successful checks"""
+        key = (self.password_hash, hashlib.sha256(password.encode()).hexdigest())
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return True
+        
+        if not pwd_context.verify(password, self.password_hash):
+            return False
+        
+        _verify_cache[key] = True
+        if len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+        return True
+    
+    def needs_rehash(self):
+        """Check if the stored hash uses a deprecated scheme or outdated parameters"""
+        return pwd_context.needs_update(self.password_hash)
     
     def __repr__(self):
         return f"<User(username='{self.username}', email='{self.email}')>"
@@ -47,9 +88,14 @@ class Board(Base):
     
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    # Computed by SQLite inside the INSERT/UPDATE itself (local time, like created_at)
+    updated_at = Column(
+        DateTime,
+        default=func.datetime('now', 'localtime'),
+        onupdate=func.datetime('now', 'localtime'),
+    )
     
     # Relationships
     owner = relationship("User", back_populates="boards")
@@ -64,6 +110,10 @@ class BoardColumn(Base):
     """Column definition for a board"""
     
     __tablename__ = 'board_columns'
+    __table_args__ = (
+        # Serves both the board_id filter and the ORDER BY position
+        Index('ix_board_columns_board_position', 'board_id', 'position'),
+    )
     
     id = Column(Integer, primary_key=True)
     board_id = Column(Integer, ForeignKey('boards.id'), nullable=False)
@@ -83,17 +133,22 @@ class Task(Base):
     """Task/row in a board"""
     
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Serves both the board_id filter and the ORDER BY position
+        Index('ix_tasks_board_position', 'board_id', 'position'),
+    )
     
     id = Column(Integer, primary_key=True)
     board_id = Column(Integer, ForeignKey('boards.id'), nullable=False)
     name = Column(String(200), nullable=False)
     position = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     
     # Relationships
     board = relationship("Board", back_populates="tasks")
-    cells = relationship("TaskCell", back_populates="task", cascade="all, delete-orphan")
+    # The database deletes a task's cells itself (ON DELETE CASCADE), so deleting
+    # a task doesn't load its cells to delete them one by one
+    cells = relationship("TaskCell", back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Task(name='{self.name}', board_id={self.board_id})>"
@@ -103,13 +158,17 @@ class TaskCell(Base):
     """Cell value for a task in a specific column"""
     
     __tablename__ = 'task_cells'
+    __table_args__ = (
+        # One value per task/column. A unique index rather than a UniqueConstraint
+        # so it can also be added to tables created before it existed.
+        Index('uq_task_cells_task_column', 'task_id', 'column_id', unique=True),
+    )
     
     id = Column(Integer, primary_key=True)
-    task_id = Column(Integer, ForeignKey('tasks.id'), nullable=False)
-    column_id = Column(Integer, ForeignKey('board_columns.id'), nullable=False)
+    task_id = Column(Integer, ForeignKey('tasks.id', ondelete='CASCADE'), nullable=False)
+    column_id = Column(Integer, ForeignKey('board_columns.id', ondelete='CASCADE'), nullable=False, index=True)
     value = Column(Text)  # Stores text, status, or date as string
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     
     # Relationship
     task = relationship("Task", back_populates="cells")
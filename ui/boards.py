@@ -1,38 +1,97 @@
 import flet as ft
-from database import get_session
-from models import Board
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from database import SessionLocal
+from models import Board, BoardColumn, Task
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.exc import IntegrityError
+from collections import namedtuple
 from datetime import datetime
 from ui.tasks import TaskTableView
 
 
+# Detached snapshot of the board fields the sidebar uses
+BoardRow = namedtuple('BoardRow', 'id name updated_at task_count')
+
+
 def show_snackbar(page: ft.Page, message: str, is_error: bool = False):
     """Helper function to show snackbar notifications"""
     snackbar = ft.SnackBar(
         content=ft.Text(message),
         bgcolor=ft.Colors.RED_700 if is_error else ft.Colors.GREEN_700,
     )
-    snackbar.open = True
-    page.overlay.append(snackbar)
-    page.update()
+    # Patches only the page's dialog stack instead of piling up in the overlay
+    page.show_dialog(snackbar)
 
 
 class BoardSidebar(ft.Container):
     """Sidebar showing list of boards - supports both guest and logged-in users"""
     
-    def __init__(self, page: ft.Page, user, on_board_select, on_refresh, is_guest=False):
+    # Board item look per selection state, resolved once for all items
+    _STYLES = {
+        True: dict(
+            icon_color=ft.Colors.WHITE,
+            text_color=ft.Colors.WHITE,
+            weight=ft.FontWeight.BOLD,
+            menu_color=ft.Colors.WHITE,
+            bg=ft.Colors.BLUE_700,
+        ),
+        False: dict(
+            icon_color=ft.Colors.BLUE_GREY_400,
+            text_color=ft.Colors.BLUE_GREY_300,
+            weight=ft.FontWeight.NORMAL,
+            menu_color=ft.Colors.BLUE_GREY_400,
+            bg=None,
+        ),
+    }
+    
+    def __init__(self, page: ft.Page, user, on_board_select, on_refresh, is_guest=False, on_board_delete=None):
         super().__init__()
         self.app_page = page
         self.user = user
         self.on_board_select = on_board_select
         self.on_refresh = on_refresh
+        self.on_board_delete = on_board_delete
         self.selected_board_id = None
         self.is_guest = is_guest
         
-        # In-memory storage for guest boards
-        self.guest_boards = []
+        # In-memory storage for guest boards, keyed by id in creation order
+        self.guest_boards = {}
         self.guest_board_counter = 0
         
+        # Board list for logged-in users - None until loaded or after a mutation
+        self._boards_cache = None
+        
+        # Controls of each listed board item: {board_id: (container, icon, text, menu)}
+        self._board_controls = {}
+        
+        # Listed boards by id and the handlers board item clicks dispatch to -
+        # item controls carry (action, board_id) in their data instead of a closure
+        self._boards_by_id = {}
+        self._item_actions = {
+            "select": self.select_board,
+            "rename": self.show_rename_dialog,
+            "delete": self.show_delete_dialog,
+        }
+        
+        # Built board items keyed by (board_id, name, task_count), reused while the board is unchanged
+        self._item_cache = {}
+        
+        # Set while a refresh_boards() reload is scheduled but hasn't run yet
+        self._reload_pending = False
+        
+        # Set by dispose() - a reload scheduled before logout must not touch the closed session
+        self._disposed = False
+        
+        # One session for all of the sidebar's queries and writes, closed by dispose().
+        # Its own session rather than the thread's scoped one, so closing it never
+        # detaches the objects the board views have loaded.
+        self._session = None if is_guest else SessionLocal()
+        
+        # Runs all of the session's work off the UI thread. A session must not be used
+        # from two threads at once, so there is exactly one worker.
+        self._executor = None if is_guest else ThreadPoolExecutor(max_workers=1)
+        
         # Add board button
         self.add_board_btn = ft.ElevatedButton(
             content=ft.Text("+ New Board"),
@@ -42,370 +101,529 @@ class BoardSidebar(ft.Container):
             on_click=self.show_add_board_dialog,
         )
         
-        # Boards list container
-        self.boards_list = ft.Column(
+        # Create/rename/delete dialogs - built once and reopened for every board
+        self._add_field = ft.TextField(label="Board Name", autofocus=True, width=300)
+        self._add_dialog = ft.AlertDialog(
+            title=ft.Text("Create New Board"),
+            content=self._add_field,
+            actions=[
+                ft.TextButton("Cancel", on_click=lambda e: self._close_dialog(self._add_dialog)),
+                ft.ElevatedButton("Create", on_click=self.create_board),
+            ],
+        )
+        
+        self._rename_target = None
+        self._rename_field = ft.TextField(label="Board Name", autofocus=True, width=300)
+        self._rename_dialog = ft.AlertDialog(
+            title=ft.Text("Rename Board"),
+            content=self._rename_field,
+            actions=[
+                ft.TextButton("Cancel", on_click=lambda e: self._close_dialog(self._rename_dialog)),
+                ft.ElevatedButton("Rename", on_click=self.rename_board),
+            ],
+        )
+        
+        self._delete_target = None
+        self._delete_text = ft.Text()
+        self._delete_dialog = ft.AlertDialog(
+            title=ft.Text("Delete Board"),
+            content=self._delete_text,
+            actions=[
+                ft.TextButton("Cancel", on_click=lambda e: self._close_dialog(self._delete_dialog)),
+                ft.ElevatedButton(
+                    "Delete",
+                    bgcolor=ft.Colors.RED_700,
+                    color=ft.Colors.WHITE,
+                    on_click=self.delete_board
+                ),
+            ],
+        )
+        
+        self._dialogs = (self._add_dialog, self._rename_dialog, self._delete_dialog)
+        self._dialogs_attached = False
+        
+        # Boards list container - a ListView so the client only lays out
+        # the items scrolled into view
+        self.boards_list = ft.ListView(
             spacing=5,
-            scroll=ft.ScrollMode.AUTO,
+            expand=True,
         )
         
-        # Build sidebar
-        self.content = ft.Container(
+        # Static sidebar chrome
+        self._header_container = ft.Container(
             content=ft.Column(
                 [
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                ft.Text(
-                                    "My Boards",
-                                    size=20,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=ft.Colors.WHITE,
-                                ),
-                                ft.Text(
-                                    "👤 Guest Mode" if is_guest else "💾 Saved",
-                                    size=11,
-                                    color=ft.Colors.AMBER_400 if is_guest else ft.Colors.GREEN_400,
-                                    italic=True,
-                                ),
-                            ],
-                            spacing=2,
-                        ),
-                        padding=ft.padding.only(left=15, top=15, bottom=10),
-                    ),
-                    ft.Container(
-                        content=self.add_board_btn,
-                        padding=ft.padding.symmetric(horizontal=15),
+                    ft.Text(
+                        "My Boards",
+                        size=20,
+                        weight=ft.FontWeight.BOLD,
+                        color=ft.Colors.WHITE,
                     ),
-                    ft.Divider(color=ft.Colors.BLUE_GREY_700, height=20),
-                    ft.Container(
-                        content=self.boards_list,
-                        padding=ft.padding.symmetric(horizontal=10),
-                        expand=True,
+                    ft.Text(
+                        "👤 Guest Mode" if is_guest else "💾 Saved",
+                        size=11,
+                        color=ft.Colors.AMBER_400 if is_guest else ft.Colors.GREEN_400,
+                        italic=True,
                     ),
                 ],
+                spacing=2,
             ),
-            width=250,
-            bgcolor=ft.Colors.BLUE_GREY_900,
-            padding=0,
+            padding=ft.padding.only(left=15, top=15, bottom=10),
+        )
+        self._add_btn_container = ft.Container(
+            content=self.add_board_btn,
+            padding=ft.padding.symmetric(horizontal=15),
         )
+        self._divider = ft.Divider(color=ft.Colors.BLUE_GREY_700, height=20)
         
-        # Load boards
-        self.load_boards()
+        # The only part of the sidebar that changes - list reloads patch just this subtree
+        self._boards_list_container = ft.Container(
+            content=self.boards_list,
+            padding=ft.padding.symmetric(horizontal=10),
+            expand=True,
+        )
+        
+        # Build sidebar - the column sits directly in the sidebar itself,
+        # no extra wrapper container
+        self.content = ft.Column(
+            [
+                self._header_container,
+                self._add_btn_container,
+                self._divider,
+                self._boards_list_container,
+            ],
+        )
+        self.width = 250
+        self.bgcolor = ft.Colors.BLUE_GREY_900
+        self.padding = 0
+        
+        # Load boards - the first draw goes out when the dashboard is added to the page
+        self.load_boards(update=False)
     
-    def load_boards(self):
+    def get_board(self, board_id):
+        """Get a board as last loaded into the list, or None if it's no longer there"""
+        return self._boards_by_id.get(board_id)
+    
+    def load_boards(self, update=True):
         """Load boards - from database for users, from memory for guests"""
         self.boards_list.controls.clear()
+        self._board_controls.clear()
         
-        if self.is_guest:
-            # Load from in-memory storage for guests
-            boards = self.guest_boards
-            
-            if not boards:
-                self.boards_list.controls.append(
-                    ft.Container(
-                        content=ft.Text(
-                            "No boards yet\nCreate one to get started!",
-                            size=14,
-                            color=ft.Colors.GREY_400,
-                            italic=True,
-                            text_align=ft.TextAlign.CENTER,
-                        ),
-                        padding=10,
-                    )
+        try:
+            boards = self._get_boards()
+        except Exception as ex:
+            show_snackbar(self.app_page, f"Error loading boards: {str(ex)}", is_error=True)
+            return
+        
+        self._boards_by_id = {board.id: board for board in boards}
+        
+        if not boards:
+            self.boards_list.controls.append(
+                ft.Container(
+                    content=ft.Text(
+                        "No boards yet\nCreate one to get started!",
+                        size=14,
+                        color=ft.Colors.GREY_400,
+                        italic=True,
+                        text_align=ft.TextAlign.CENTER,
+                    ),
+                    padding=10,
                 )
-            else:
-                for board in boards:
-                    board_item = self.create_board_item(board)
-                    self.boards_list.controls.append(board_item)
+            )
         else:
-            # Load from database for logged-in users
-            session = get_session()
-            try:
-                boards = session.query(Board).filter_by(user_id=self.user.id).order_by(Board.updated_at.desc()).all()
-                
-                if not boards:
-                    self.boards_list.controls.append(
-                        ft.Container(
-                            content=ft.Text(
-                                "No boards yet\nCreate one to get started!",
-                                size=14,
-                                color=ft.Colors.GREY_400,
-                                italic=True,
-                                text_align=ft.TextAlign.CENTER,
-                            ),
-                            padding=10,
-                        )
-                    )
-                else:
-                    for board in boards:
-                        board_item = self.create_board_item(board)
-                        self.boards_list.controls.append(board_item)
-            except Exception as ex:
-                show_snackbar(self.app_page, f"Error loading boards: {str(ex)}", is_error=True)
-            finally:
-                session.close()
+            for board in boards:
+                # Guest tasks live only in their board's view, so guests get no count
+                task_count = None if self.is_guest else board.task_count
+                board_item = self.create_board_item(board, task_count)
+                self.boards_list.controls.append(board_item)
+        
+        # Drop cached items of boards that were renamed or deleted
+        self._item_cache = {
+            key: item_controls for key, item_controls in self._item_cache.items()
+            if self._board_controls.get(key[0]) is item_controls
+        }
+        
+        if update:
+            self.app_page.update(self._boards_list_container)
+    
+    def _get_boards(self):
+        """Get boards to list - the database query runs only when the cache is empty"""
+        if self.is_guest:
+            # In-memory storage for guests
+            return list(self.guest_boards.values())
+        
+        if self._boards_cache is None:
+            self._boards_cache = self._executor.submit(self._query_boards).result()
         
-        self.app_page.update()
+        return self._boards_cache
+    
+    def _query_boards(self):
+        """Query the user's boards with their task counts - runs on the DB worker"""
+        try:
+            # Task counts come from the same query - one round-trip however many boards.
+            # Only the listed columns are selected, so no Board instances are built.
+            rows = (
+                self._session.query(Board.id, Board.name, Board.updated_at, func.count(Task.id))
+                .outerjoin(Task, Task.board_id == Board.id)
+                .filter(Board.user_id == self.user.id)
+                .group_by(Board.id)
+                # id breaks ties between boards saved within the same timestamp
+                .order_by(Board.updated_at.desc(), Board.id.desc())
+            )
+            boards = [BoardRow._make(row) for row in rows]
+            # End the read so the session doesn't keep a pooled connection checked out
+            self._session.commit()
+            return boards
+        except Exception:
+            self._session.rollback()
+            raise
+    
+    async def _run_db(self, fn, *args):
+        """Run a database helper on the DB worker without blocking the UI"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
     
-    def create_board_item(self, board):
-        """Create a board list item"""
-        is_selected = self.selected_board_id == board.id
+    async def _reload_from_db(self):
+        """Re-query the board list on the DB worker so the redraw that follows doesn't block"""
+        self._boards_cache = None
+        self._boards_cache = await self._run_db(self._query_boards)
+    
+    def refresh_boards(self):
+        """Re-query and redraw the board list, e.g. after a board's tasks changed"""
+        if self._disposed:
+            return
+        self._boards_cache = None
         
-        return ft.Container(
-            content=ft.Row(
-                [
-                    ft.Icon(
-                        ft.Icons.DASHBOARD,
-                        size=20,
-                        color=ft.Colors.WHITE if is_selected else ft.Colors.BLUE_GREY_400,
-                    ),
-                    ft.Text(
-                        board.name,
-                        size=14,
-                        color=ft.Colors.WHITE if is_selected else ft.Colors.BLUE_GREY_300,
-                        weight=ft.FontWeight.BOLD if is_selected else ft.FontWeight.NORMAL,
-                        expand=True,
-                    ),
-                    ft.PopupMenuButton(
-                        icon=ft.Icons.MORE_VERT,
-                        icon_color=ft.Colors.WHITE if is_selected else ft.Colors.BLUE_GREY_400,
-                        icon_size=18,
-                        items=[
-                            ft.PopupMenuItem(
-                                content=ft.Text("Rename"),
-                                icon=ft.Icons.EDIT,
-                                on_click=lambda e, b=board: self.show_rename_dialog(b),
-                            ),
-                            ft.PopupMenuItem(
-                                content=ft.Text("Delete"),
-                                icon=ft.Icons.DELETE,
-                                on_click=lambda e, b=board: self.show_delete_dialog(b),
-                            ),
-                        ],
-                    ),
-                ],
-                spacing=10,
-            ),
+        # Deferred to the event loop - calls made before it runs share one reload
+        if not self._reload_pending:
+            self._reload_pending = True
+            self.app_page.run_task(self._flush_reload)
+    
+    async def _flush_reload(self):
+        """Run the reload scheduled by refresh_boards()"""
+        self._reload_pending = False
+        if self._disposed:
+            return
+        if self._boards_cache is None and self._session is not None:
+            self._boards_cache = await self._run_db(self._query_boards)
+        self.load_boards()
+    
+    def create_board_item(self, board, task_count=None):
+        """Create a board list item, reusing the one built for an unchanged board"""
+        key = (board.id, board.name, task_count)
+        item_controls = self._item_cache.get(key)
+        if item_controls:
+            # Selection is restyled in place, so bring the reused item up to date
+            self._style_board_item(item_controls, self.selected_board_id == board.id)
+            self._board_controls[board.id] = item_controls
+            return item_controls[0]
+        
+        icon = ft.Icon(ft.Icons.DASHBOARD, size=20)
+        text = ft.Text(board.name, size=14, expand=True)
+        menu = ft.PopupMenuButton(
+            icon=ft.Icons.MORE_VERT,
+            icon_size=18,
+            items=[
+                ft.PopupMenuItem(
+                    content=ft.Text("Rename"),
+                    icon=ft.Icons.EDIT,
+                    data=("rename", board.id),
+                    on_click=self._on_item_event,
+                ),
+                ft.PopupMenuItem(
+                    content=ft.Text("Delete"),
+                    icon=ft.Icons.DELETE,
+                    data=("delete", board.id),
+                    on_click=self._on_item_event,
+                ),
+            ],
+        )
+        row_controls = [icon, text]
+        if task_count is not None:
+            row_controls.append(
+                ft.Container(
+                    content=ft.Text(str(task_count), size=11, color=ft.Colors.WHITE),
+                    bgcolor=ft.Colors.BLUE_GREY_700,
+                    padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                    border_radius=10,
+                )
+            )
+        row_controls.append(menu)
+        container = ft.Container(
+            content=ft.Row(row_controls, spacing=10),
             padding=10,
             border_radius=5,
-            bgcolor=ft.Colors.BLUE_700 if is_selected else None,
-            on_click=lambda e, b=board: self.select_board(b),
+            data=("select", board.id),
+            on_click=self._on_item_event,
             ink=True,
         )
+        
+        item_controls = (container, icon, text, menu)
+        self._style_board_item(item_controls, self.selected_board_id == board.id)
+        self._board_controls[board.id] = item_controls
+        self._item_cache[key] = item_controls
+        return container
+    
+    def _on_item_event(self, e):
+        """Dispatch a click on a board item or its menu to the matching handler"""
+        action, board_id = e.control.data
+        board = self._boards_by_id.get(board_id)
+        if board is not None:
+            self._item_actions[action](board)
+    
+    def _style_board_item(self, item_controls, is_selected):
+        """Apply the selected/unselected look to a board item's controls"""
+        container, icon, text, menu = item_controls
+        style = self._STYLES[is_selected]
+        icon.color = style["icon_color"]
+        text.color = style["text_color"]
+        text.weight = style["weight"]
+        menu.icon_color = style["menu_color"]
+        container.bgcolor = style["bg"]
     
     def select_board(self, board):
         """Handle board selection"""
+        # Restyle only the previously and newly selected items instead of rebuilding the list
+        changed = []
+        for board_id, is_selected in ((self.selected_board_id, False), (board.id, True)):
+            item_controls = self._board_controls.get(board_id)
+            if item_controls:
+                self._style_board_item(item_controls, is_selected)
+                changed.append(item_controls[0])
+        
         self.selected_board_id = board.id
-        self.load_boards()  # Refresh to show selection
+        if changed:
+            self.app_page.update(*changed)
         if self.on_board_select:
             self.on_board_select(board)
     
-    def show_add_board_dialog(self, e):
-        """Show dialog to add new board"""
-        board_name_field = ft.TextField(
-            label="Board Name",
-            autofocus=True,
-            width=300,
-        )
+    def dispose(self):
+        """Close the sidebar's database session and take its dialogs off the page"""
+        self._disposed = True
+        if self._session is not None:
+            # Closed on the worker, after any write still in flight
+            self._executor.submit(self._session.close)
+            self._executor.shutdown()
+            self._session = None
         
-        def close_dialog(e):
-            dialog.open = False
+        if self._dialogs_attached:
+            # Compared by identity - Flet controls compare equal field by field
+            overlay = self.app_page.overlay
+            overlay[:] = [c for c in overlay if not any(c is d for d in self._dialogs)]
+            self._dialogs_attached = False
+    
+    def _batch_update(self, dialog, message):
+        """Close a dialog, show a message and reload the board list, patching only what changed"""
+        dialog.open = False
+        show_snackbar(self.app_page, message)
+        self.load_boards(update=False)
+        self.app_page.update(dialog, self._boards_list_container)
+    
+    def _open_dialog(self, dialog):
+        """Open one of the prebuilt dialogs, adding them all to the page overlay on first use"""
+        dialog.open = True
+        if not self._dialogs_attached:
+            self.app_page.overlay.extend(self._dialogs)
+            self._dialogs_attached = True
             self.app_page.update()
+        else:
+            self.app_page.update(dialog)
+    
+    def _close_dialog(self, dialog):
+        """Close one of the prebuilt dialogs"""
+        dialog.open = False
+        self.app_page.update(dialog)
+    
+    def show_add_board_dialog(self, e):
+        """Show dialog to add new board"""
+        self._add_field.value = ""
+        self._open_dialog(self._add_dialog)
+    
+    async def create_board(self, e):
+        """Create a board from the add dialog"""
+        name = self._add_field.value
+        if not name:
+            show_snackbar(self.app_page, "Board name is required", is_error=True)
+            return
         
-        def create_board(e):
-            name = board_name_field.value
-            if not name:
-                show_snackbar(self.app_page, "Board name is required", is_error=True)
+        if self.is_guest:
+            # Create in-memory board for guests
+            self.guest_board_counter += 1
+            new_board = type('GuestBoard', (), {
+                'id': self.guest_board_counter,
+                'name': name,
+                'created_at': datetime.now(),
+                'updated_at': datetime.now()
+            })()
+            self.guest_boards[new_board.id] = new_board
+            
+            self._batch_update(self._add_dialog, f"Board '{name}' created! (Guest mode - not saved)")
+            if self.on_refresh:
+                self.on_refresh()
+        else:
+            # Save to database for logged-in users
+            try:
+                await self._run_db(self._db_create, name)
+                await self._reload_from_db()
+            except Exception as ex:
+                show_snackbar(self.app_page, f"Error creating board: {str(ex)}", is_error=True)
                 return
             
-            if self.is_guest:
-                # Create in-memory board for guests
-                self.guest_board_counter += 1
-                new_board = type('GuestBoard', (), {
-                    'id': self.guest_board_counter,
-                    'name': name,
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now()
-                })()
-                self.guest_boards.append(new_board)
-                
-                show_snackbar(self.app_page, f"Board '{name}' created! (Guest mode - not saved)")
-                close_dialog(e)
-                self.load_boards()
-                if self.on_refresh:
-                    self.on_refresh()
-            else:
-                # Save to database for logged-in users
-                session = get_session()
-                try:
-                    new_board = Board(name=name, user_id=self.user.id)
-                    session.add(new_board)
-                    session.commit()
-                    
-                    show_snackbar(self.app_page, f"Board '{name}' created!")
-                    close_dialog(e)
-                    self.load_boards()
-                    if self.on_refresh:
-                        self.on_refresh()
-                except Exception as ex:
-                    session.rollback()
-                    show_snackbar(self.app_page, f"Error creating board: {str(ex)}", is_error=True)
-                finally:
-                    session.close()
-        
-        dialog = ft.AlertDialog(
-            title=ft.Text("Create New Board"),
-            content=board_name_field,
-            actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
-                ft.ElevatedButton("Create", on_click=create_board),
-            ],
-        )
-        
-        self.app_page.overlay.append(dialog)
-        dialog.open = True
-        self.app_page.update()
+            self._batch_update(self._add_dialog, f"Board '{name}' created!")
+            if self.on_refresh:
+                self.on_refresh()
+    
+    def _db_create(self, name):
+        """Insert a board - runs on the DB worker"""
+        try:
+            self._session.add(Board(name=name, user_id=self.user.id))
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
     
     def show_rename_dialog(self, board):
         """Show dialog to rename board"""
-        board_name_field = ft.TextField(
-            label="Board Name",
-            value=board.name,
-            autofocus=True,
-            width=300,
-        )
-        
-        def close_dialog(e):
-            dialog.open = False
-            self.app_page.update()
+        self._rename_target = board
+        self._rename_field.value = board.name
+        self._open_dialog(self._rename_dialog)
+    
+    async def rename_board(self, e):
+        """Rename the board the rename dialog was opened for"""
+        board = self._rename_target
+        new_name = self._rename_field.value
+        if not new_name:
+            show_snackbar(self.app_page, "Board name is required", is_error=True)
+            return
         
-        def rename_board(e):
-            new_name = board_name_field.value
-            if not new_name:
-                show_snackbar(self.app_page, "Board name is required", is_error=True)
+        if self.is_guest:
+            # Update in-memory board for guests
+            guest_board = self.guest_boards.get(board.id)
+            if guest_board:
+                guest_board.name = new_name
+                guest_board.updated_at = datetime.now()
+            
+            self._batch_update(self._rename_dialog, f"Board renamed to '{new_name}'")
+            if self.on_refresh:
+                self.on_refresh()
+        else:
+            # Update database for logged-in users
+            try:
+                renamed = await self._run_db(self._db_rename, board.id, new_name)
+                if renamed:
+                    await self._reload_from_db()
+            except Exception as ex:
+                show_snackbar(self.app_page, f"Error renaming board: {str(ex)}", is_error=True)
                 return
             
-            if self.is_guest:
-                # Update in-memory board for guests
-                for guest_board in self.guest_boards:
-                    if guest_board.id == board.id:
-                        guest_board.name = new_name
-                        guest_board.updated_at = datetime.now()
-                        break
-                
-                show_snackbar(self.app_page, f"Board renamed to '{new_name}'")
-                close_dialog(e)
-                self.load_boards()
-                if self.on_refresh:
-                    self.on_refresh()
-            else:
-                # Update database for logged-in users
-                session = get_session()
-                try:
-                    db_board = session.query(Board).filter_by(id=board.id).first()
-                    if db_board:
-                        db_board.name = new_name
-                        session.commit()
-                        
-                        show_snackbar(self.app_page, f"Board renamed to '{new_name}'")
-                        close_dialog(e)
-                        self.load_boards()
-                        if self.on_refresh:
-                            self.on_refresh()
-                except Exception as ex:
-                    session.rollback()
-                    show_snackbar(self.app_page, f"Error renaming board: {str(ex)}", is_error=True)
-                finally:
-                    session.close()
-        
-        dialog = ft.AlertDialog(
-            title=ft.Text("Rename Board"),
-            content=board_name_field,
-            actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
-                ft.ElevatedButton("Rename", on_click=rename_board),
-            ],
-        )
-        
-        self.app_page.overlay.append(dialog)
-        dialog.open = True
-        self.app_page.update()
+            if not renamed:
+                show_snackbar(self.app_page, "Board not found", is_error=True)
+                return
+            
+            self._batch_update(self._rename_dialog, f"Board renamed to '{new_name}'")
+            if self.on_refresh:
+                self.on_refresh()
+    
+    def _db_rename(self, board_id, new_name):
+        """Rename a board, returns whether it existed - runs on the DB worker"""
+        try:
+            # One UPDATE instead of loading the board first; updated_at is
+            # still bumped by the column's onupdate default
+            result = self._session.execute(
+                update(Board)
+                .where(Board.id == board_id, Board.user_id == self.user.id)
+                .values(name=new_name)
+            )
+            self._session.commit()
+            return bool(result.rowcount)
+        except Exception:
+            self._session.rollback()
+            raise
     
     def show_delete_dialog(self, board):
         """Show confirmation dialog to delete board"""
-        def close_dialog(e):
-            dialog.open = False
-            self.app_page.update()
-        
-        def delete_board(e):
-            if self.is_guest:
-                # Delete from in-memory storage for guests
-                self.guest_boards = [b for b in self.guest_boards if b.id != board.id]
-                
-                show_snackbar(self.app_page, f"Board '{board.name}' deleted")
-                close_dialog(e)
-                
-                # Clear selection if deleted board was selected
-                if self.selected_board_id == board.id:
-                    self.selected_board_id = None
-                
-                self.load_boards()
-                if self.on_refresh:
-                    self.on_refresh()
-            else:
-                # Delete from database for logged-in users
-                session = get_session()
-                try:
-                    db_board = session.query(Board).filter_by(id=board.id).first()
-                    if db_board:
-                        session.delete(db_board)
-                        session.commit()
-                        
-                        show_snackbar(self.app_page, f"Board '{board.name}' deleted")
-                        close_dialog(e)
-                        
-                        # Clear selection if deleted board was selected
-                        if self.selected_board_id == board.id:
-                            self.selected_board_id = None
-                        
-                        self.load_boards()
-                        if self.on_refresh:
-                            self.on_refresh()
-                except Exception as ex:
-                    session.rollback()
-                    show_snackbar(self.app_page, f"Error deleting board: {str(ex)}", is_error=True)
-                finally:
-                    session.close()
-        
-        dialog = ft.AlertDialog(
-            title=ft.Text("Delete Board"),
-            content=ft.Text(f"Are you sure you want to delete '{board.name}'? This action cannot be undone."),
-            actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
-                ft.ElevatedButton(
-                    "Delete",
-                    bgcolor=ft.Colors.RED_700,
-                    color=ft.Colors.WHITE,
-                    on_click=delete_board
-                ),
-            ],
-        )
-        
-        self.app_page.overlay.append(dialog)
-        dialog.open = True
-        self.app_page.update()
+        self._delete_target = board
+        self._delete_text.value = f"Are you sure you want to delete '{board.name}'? This action cannot be undone."
+        self._open_dialog(self._delete_dialog)
+    
+    async def delete_board(self, e):
+        """Delete the board the delete dialog was opened for"""
+        board = self._delete_target
+        if self.is_guest:
+            # Delete from in-memory storage for guests
+            self.guest_boards.pop(board.id, None)
+            
+            # Clear selection if deleted board was selected
+            if self.selected_board_id == board.id:
+                self.selected_board_id = None
+            
+            self._batch_update(self._delete_dialog, f"Board '{board.name}' deleted")
+            if self.on_board_delete:
+                self.on_board_delete(board)
+            if self.on_refresh:
+                self.on_refresh()
+        else:
+            # Delete from database for logged-in users
+            try:
+                deleted = await self._run_db(self._db_delete, board.id)
+                if deleted:
+                    await self._reload_from_db()
+            except Exception as ex:
+                show_snackbar(self.app_page, f"Error deleting board: {str(ex)}", is_error=True)
+                return
+            
+            if not deleted:
+                show_snackbar(self.app_page, "Board not found", is_error=True)
+                return
+            
+            # Clear selection if deleted board was selected
+            if self.selected_board_id == board.id:
+                self.selected_board_id = None
+            
+            self._batch_update(self._delete_dialog, f"Board '{board.name}' deleted")
+            if self.on_board_delete:
+                self.on_board_delete(board)
+            if self.on_refresh:
+                self.on_refresh()
+    
+    def _db_delete(self, board_id):
+        """Delete a board and everything on it, returns whether it existed - runs on the DB worker"""
+        try:
+            # Delete with bulk statements instead of loading the board and its
+            # children. Cells go with their tasks (ON DELETE CASCADE); tasks and
+            # columns have no cascade in the database, so they go explicitly.
+            owned = select(Board.id).where(Board.id == board_id, Board.user_id == self.user.id)
+            self._session.execute(delete(Task).where(Task.board_id.in_(owned)))
+            self._session.execute(delete(BoardColumn).where(BoardColumn.board_id.in_(owned)))
+            result = self._session.execute(
+                delete(Board).where(Board.id == board_id, Board.user_id == self.user.id)
+            )
+            self._session.commit()
+            return bool(result.rowcount)
+        except Exception:
+            self._session.rollback()
+            raise
 
 
 class BoardView(ft.Container):
     """Main board view with task table"""
     
-    def __init__(self, page: ft.Page, board=None, is_guest=False):
+    def __init__(self, page: ft.Page, board=None, is_guest=False, on_tasks_change=None):
         super().__init__()
         self.app_page = page
         self.board = board
         self.is_guest = is_guest
+        self.task_table = None
         
         if board:
+            self.board_title = ft.Text(
+                board.name,
+                size=28,
+                weight=ft.FontWeight.BOLD,
+                color=ft.Colors.BLUE_700,
+            )
+            
+            self.task_table = TaskTableView(page, board, is_guest=is_guest, on_refresh=on_tasks_change)
+            
             # Board with task table
             self.content = ft.Column(
                 [
@@ -414,12 +632,7 @@ class BoardView(ft.Container):
                         content=ft.Row(
                             [
                                 ft.Icon(ft.Icons.DASHBOARD, size=32, color=ft.Colors.BLUE_700),
-                                ft.Text(
-                                    board.name,
-                                    size=28,
-                                    weight=ft.FontWeight.BOLD,
-                                    color=ft.Colors.BLUE_700,
-                                ),
+                                self.board_title,
                             ],
                             spacing=15,
                         ),
@@ -428,7 +641,7 @@ class BoardView(ft.Container):
                     ),
                     ft.Divider(height=1),
                     # Task table
-                    TaskTableView(page, board, is_guest=is_guest),
+                    self.task_table,
                 ],
                 expand=True,
                 spacing=0,
@@ -465,3 +678,13 @@ class BoardView(ft.Container):
             )
         
         self.expand = True
+    
+    def set_board(self, board):
+        """Refresh board metadata (e.g. after a rename) without rebuilding the task table"""
+        self.board = board
+        self.board_title.value = board.name
+    
+    def dispose(self, flush=True):
+        """Release the task table's database session, writing its unsaved edits unless flush is False"""
+        if self.task_table:
+            self.task_table.dispose(flush=flush)
@@ -1,8 +1,34 @@
 import flet as ft
-from database import get_session
+import logging
+import queue
+import threading
+from database import SessionLocal, load_board
 from models import BoardColumn, Task, TaskCell
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm.attributes import set_committed_value
+from dataclasses import dataclass
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
+# Columns every new board starts with: (name, column_type)
+DEFAULT_COLUMNS = [
+    ("Status", "status"),
+    ("Notes", "text"),
+    ("Due Date", "date"),
+]
+
+# Seconds a typed cell value waits before it is written, so the on_submit/on_blur
+# pair and quick re-edits of the same cell end in a single commit
+CELL_WRITE_DELAY = 0.15
+
+# Every task row has the same height, so the list can lay out only the rows on screen
+ROW_HEIGHT = 60
+
+# Rows built per step - the first step on refresh, the next whenever scrolling nears the end
+ROW_BATCH = 50
 
 # Status options with colors
 STATUS_OPTIONS = {
@@ -12,6 +38,14 @@ STATUS_OPTIONS = {
     "": ft.Colors.GREY_400,  # Empty/not set
 }
 
+# Click order of the status values and each value's place in it, for cycle_status
+STATUS_KEYS = tuple(STATUS_OPTIONS)
+STATUS_INDEX = {value: index for index, value in enumerate(STATUS_KEYS)}
+
+# Badge text and its color for each status value, worked out once instead of per cell
+STATUS_LABELS = {value: value or "Not set" for value in STATUS_OPTIONS}
+STATUS_TEXT_COLORS = {value: ft.Colors.WHITE if value else ft.Colors.GREY_600 for value in STATUS_OPTIONS}
+
 
 def show_snackbar(page: ft.Page, message: str, is_error: bool = False):
     """Helper function to show snackbar notifications"""
@@ -19,9 +53,26 @@ def show_snackbar(page: ft.Page, message: str, is_error: bool = False):
         content=ft.Text(message),
         bgcolor=ft.Colors.RED_700 if is_error else ft.Colors.GREEN_700,
     )
-    snackbar.open = True
-    page.overlay.append(snackbar)
-    page.update()
+    # Patches only the page's dialog stack, so a message never re-diffs the table
+    page.show_dialog(snackbar)
+
+
+@dataclass(slots=True)
+class GuestColumn:
+    """In-memory column for guest mode - never stored in the database"""
+    id: int
+    name: str
+    column_type: str
+    position: int
+
+
+@dataclass(slots=True)
+class GuestTask:
+    """In-memory task for guest mode - never stored in the database"""
+    id: int
+    name: str
+    position: int
+    board_id: int
 
 
 class TaskTableView(ft.Container):
@@ -37,19 +88,88 @@ class TaskTableView(ft.Container):
         # In-memory storage for guest mode
         self.guest_columns = []
         self.guest_tasks = []
-        self.guest_cells = {}  # {task_id: {column_id: value}}
+        self.guest_cells = {}  # {(task_id, column_id): value}
         self.guest_column_counter = 0
         self.guest_task_counter = 0
         
+        # Cell values of the displayed board: {(task_id, column_id): value}, rebuilt on refresh
+        self._cell_map = {}
+        
+        # Displayed columns and the controls built for each task and cell, so an edit
+        # only touches its own row or cell instead of rebuilding the table
+        self._columns = []
+        self._row_by_task_id = {}
+        self._cell_by_key = {}  # {(task_id, column_id): cell container}
+        
+        # Tasks whose rows haven't been built yet, in display order
+        self._unbuilt_tasks = []
+        
+        # Rows of tasks added while others were still unbuilt - kept at the end of the
+        # list, below each batch built after them, until every row above is built
+        self._early_rows = []
+        
+        # Position the next added task gets - one past the last, so adding needs no query
+        self._next_task_pos = 0
+        
+        # One session for the view's lifetime, closed by dispose(). Handlers read it on
+        # the page's event loop while the writer thread commits through it, and a session
+        # isn't thread-safe, so access is serialized.
+        # Loaded objects stay usable after commits - only refresh_table() reloads them.
+        # Every read and write ends its transaction, so the session only holds a pooled
+        # connection while it is using it.
+        self._session = None if is_guest else SessionLocal(expire_on_commit=False)
+        self._db_lock = threading.Lock()
+        
+        # Writes are queued to one background thread so handlers never wait on a commit;
+        # the UI is updated straight away and redrawn from the database if a write fails.
+        # The thread only touches the database - completions run back on the page's loop.
+        self._write_q = queue.Queue()
+        self._writer_thread = None
+        self._disposed = False
+        if not is_guest:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        
+        # Debounced text/date cell writes: {(task_id, column_id): (timer, task, column, value)}
+        self._pending_writes = {}
+        self._pending_lock = threading.Lock()
+        
         # Initialize with default columns for new boards
         if is_guest and not self.guest_columns:
             self._create_default_columns_guest()
         elif not is_guest:
             self._ensure_default_columns()
         
+        # Add column dialog - built once and reopened, added to the page overlay on first use
+        self._column_name_field = ft.TextField(label="Column Name", autofocus=True, width=300)
+        self._column_type_dropdown = ft.Dropdown(
+            label="Column Type",
+            width=300,
+            options=[
+                ft.dropdown.Option("text", "Text"),
+                ft.dropdown.Option("status", "Status"),
+                ft.dropdown.Option("date", "Date"),
+            ],
+            value="text"
+        )
+        self._add_column_dialog = ft.AlertDialog(
+            title=ft.Text("Add New Column"),
+            content=ft.Column([self._column_name_field, self._column_type_dropdown], tight=True),
+            actions=[
+                ft.TextButton("Cancel", on_click=self._close_add_column_dialog),
+                ft.ElevatedButton("Add", on_click=self.create_column),
+            ],
+        )
+        self._dialog_attached = False
+        
         # Table header and content
         self.table_header = ft.Row(scroll=ft.ScrollMode.AUTO)
-        self.table_content = ft.Column(scroll=ft.ScrollMode.AUTO, spacing=0)
+        self.table_content = ft.ListView(
+            spacing=0,
+            item_extent=ROW_HEIGHT,
+            on_scroll=self._on_scroll,
+            scroll_interval=100,
+        )
         
         # Build UI
         self.content = ft.Column(
@@ -100,65 +220,82 @@ class TaskTableView(ft.Container):
     
     def _create_default_columns_guest(self):
         """Create default columns for guest mode"""
-        self.guest_column_counter += 1
-        self.guest_columns.append(type('GuestColumn', (), {
-            'id': self.guest_column_counter,
-            'name': 'Status',
-            'column_type': 'status',
-            'position': 0
-        })())
-        
-        self.guest_column_counter += 1
-        self.guest_columns.append(type('GuestColumn', (), {
-            'id': self.guest_column_counter,
-            'name': 'Notes',
-            'column_type': 'text',
-            'position': 1
-        })())
-        
-        self.guest_column_counter += 1
-        self.guest_columns.append(type('GuestColumn', (), {
-            'id': self.guest_column_counter,
-            'name': 'Due Date',
-            'column_type': 'date',
-            'position': 2
-        })())
+        for position, (name, column_type) in enumerate(DEFAULT_COLUMNS):
+            self.guest_column_counter += 1
+            self.guest_columns.append(GuestColumn(
+                id=self.guest_column_counter,
+                name=name,
+                column_type=column_type,
+                position=position,
+            ))
     
     def _ensure_default_columns(self):
         """Ensure board has default columns"""
-        session = get_session()
-        try:
-            existing_columns = session.query(BoardColumn).filter_by(board_id=self.board.id).count()
-            if existing_columns == 0:
-                # Add default columns
-                columns = [
-                    BoardColumn(board_id=self.board.id, name="Status", column_type="status", position=0),
-                    BoardColumn(board_id=self.board.id, name="Notes", column_type="text", position=1),
-                    BoardColumn(board_id=self.board.id, name="Due Date", column_type="date", position=2),
-                ]
-                for col in columns:
-                    session.add(col)
-                session.commit()
-        except Exception as ex:
-            session.rollback()
-            show_snackbar(self.app_page, f"Error creating columns: {str(ex)}", is_error=True)
-        finally:
-            session.close()
+        with self._db_lock:
+            try:
+                existing_columns = self._session.query(BoardColumn).filter_by(board_id=self.board.id).count()
+                if existing_columns == 0:
+                    # Add default columns - one bulk INSERT instead of a unit-of-work flush per column
+                    self._session.execute(
+                        insert(BoardColumn),
+                        [
+                            {"board_id": self.board.id, "name": name, "column_type": column_type, "position": position}
+                            for position, (name, column_type) in enumerate(DEFAULT_COLUMNS)
+                        ],
+                    )
+                # Also ends the read when nothing was inserted
+                self._session.commit()
+            except Exception as ex:
+                self._session.rollback()
+                show_snackbar(self.app_page, f"Error creating columns: {str(ex)}", is_error=True)
     
     def refresh_table(self):
-        """Refresh the entire table"""
-        self.table_header.controls.clear()
-        self.table_content.controls.clear()
-        
-        # Get columns
+        """Refresh the entire table - all data is read before any control is built"""
+        columns, tasks, cell_map = self._load_data()
+        self._build_widgets(columns, tasks, cell_map)
+        self._commit_ui()
+    
+    def _load_data(self):
+        """Read the board's columns, tasks and cell values into memory"""
         if self.is_guest:
             columns = sorted(self.guest_columns, key=lambda c: c.position)
-        else:
-            session = get_session()
+            tasks = sorted(self.guest_tasks, key=lambda t: t.position)
+            # Already keyed like the cell map, so the view reads the guest cells directly
+            return columns, tasks, self.guest_cells
+        
+        # Shows what is committed - after queuing writes use _refresh_after_writes()
+        with self._db_lock:
             try:
-                columns = session.query(BoardColumn).filter_by(board_id=self.board.id).order_by(BoardColumn.position).all()
-            finally:
-                session.close()
+                # Columns, tasks and their cells arrive together, already ordered by position
+                board = load_board(self._session, self.board.id)
+                if board is None:
+                    # Deleted while the view was open - show it empty rather than fail
+                    self._session.commit()
+                    return [], [], {}
+                cell_map = {
+                    (cell.task_id, cell.column_id): cell.value
+                    for task in board.tasks
+                    for cell in task.cells
+                }
+                # End the read so the connection goes back to the pool - with
+                # expire_on_commit off the loaded objects stay as they are
+                self._session.commit()
+                return board.columns, board.tasks, cell_map
+            except Exception:
+                self._session.rollback()
+                raise
+    
+    def _build_widgets(self, columns, tasks, cell_map):
+        """Rebuild the header and first rows from loaded data, without sending them"""
+        self.table_header.controls.clear()
+        self.table_content.controls.clear()
+        self._row_by_task_id.clear()
+        self._cell_by_key.clear()
+        self._early_rows.clear()
+        
+        self._columns = columns
+        self._cell_map = cell_map
+        self._next_task_pos = tasks[-1].position + 1 if tasks else 0
         
         # Build header
         self.table_header.controls.append(
@@ -188,33 +325,80 @@ class TaskTableView(ft.Container):
                 )
             )
         
-        # Get tasks
-        if self.is_guest:
-            tasks = sorted(self.guest_tasks, key=lambda t: t.position)
-        else:
-            session = get_session()
-            try:
-                tasks = session.query(Task).filter_by(board_id=self.board.id).order_by(Task.position).all()
-            finally:
-                session.close()
-        
-        # Build rows
-        for task in tasks:
-            self.table_content.controls.append(self.create_task_row(task, columns))
+        # Build the first rows - the rest are built as they are scrolled towards
+        self._unbuilt_tasks = list(tasks)
+        self._build_more_rows()
         
         if not tasks:
-            self.table_content.controls.append(
-                ft.Container(
-                    content=ft.Text(
-                        "No tasks yet. Click '+ Add Task' to get started!",
-                        color=ft.Colors.GREY_500,
-                        italic=True,
-                    ),
-                    padding=20,
-                )
-            )
-        
-        self.app_page.update()
+            self.table_content.controls.append(self._empty_placeholder())
+    
+    def _commit_ui(self):
+        """Send the rebuilt table to the client in one patch of this view"""
+        try:
+            self.update()
+        except RuntimeError:
+            # Not on the page - still being built, or a cached board that isn't shown.
+            # The whole view is sent when it is added.
+            pass
+    
+    def _empty_placeholder(self):
+        """Create the message shown while the board has no tasks"""
+        return ft.Container(
+            content=ft.Text(
+                "No tasks yet. Click '+ Add Task' to get started!",
+                color=ft.Colors.GREY_500,
+                italic=True,
+            ),
+            padding=20,
+        )
+    
+    def _build_more_rows(self):
+        """Build the next batch of task rows; returns False once every row is built"""
+        if not self._unbuilt_tasks:
+            return False
+        
+        batch = self._unbuilt_tasks[:ROW_BATCH]
+        del self._unbuilt_tasks[:ROW_BATCH]
+        at = len(self.table_content.controls) - len(self._early_rows)
+        self.table_content.controls[at:at] = [self.create_task_row(task, self._columns) for task in batch]
+        if not self._unbuilt_tasks:
+            self._early_rows.clear()
+        return True
+    
+    def _on_scroll(self, e):
+        """Build more rows when the list is scrolled to within a screen of its end"""
+        if e.max_scroll_extent - e.pixels < e.viewport_dimension and self._build_more_rows():
+            self.table_content.update()
+    
+    def _append_task_row(self, task):
+        """Add one task's row to the table, replacing the empty-board message"""
+        if not self._row_by_task_id:
+            self.table_content.controls.clear()
+        row = self.create_task_row(task, self._columns)
+        self.table_content.controls.append(row)
+        if self._unbuilt_tasks:
+            # Shown straight away rather than built only once scrolled to
+            self._early_rows.append(row)
+        self.table_content.update()
+    
+    def _remove_task_row(self, task):
+        """Take one task's row out of the table"""
+        row = self._row_by_task_id.pop(task.id, None)
+        for col in self._columns:
+            self._cell_by_key.pop((task.id, col.id), None)
+            self._cell_map.pop((task.id, col.id), None)
+        
+        if row is not None:
+            # Removed by identity - Flet controls compare equal field by field
+            self.table_content.controls = [c for c in self.table_content.controls if c is not row]
+            self._early_rows = [r for r in self._early_rows if r is not row]
+        if len(self._row_by_task_id) < ROW_BATCH:
+            # More rows are only built on scroll, which a list too short to scroll never
+            # sends - keep at least a batch built so the rest stay reachable
+            self._build_more_rows()
+        if not self._row_by_task_id:
+            self.table_content.controls.append(self._empty_placeholder())
+        self.table_content.update()
     
     def create_task_row(self, task, columns):
         """Create a task row with cells"""
@@ -247,24 +431,21 @@ class TaskTableView(ft.Container):
             )
         )
         
-        # Column cells
+        # Column cells - values come from the eagerly loaded cells, not a query per cell
         for col in columns:
             cell_value = self.get_cell_value(task, col)
-            row_controls.append(self.create_cell(task, col, cell_value))
+            cell = self.create_cell(task, col, cell_value)
+            self._cell_by_key[(task.id, col.id)] = cell
+            row_controls.append(cell)
         
-        return ft.Row(row_controls, spacing=0)
+        row = ft.Row(row_controls, spacing=0)
+        self._row_by_task_id[task.id] = row
+        return row
     
     def get_cell_value(self, task, column):
         """Get cell value for task and column"""
-        if self.is_guest:
-            return self.guest_cells.get(task.id, {}).get(column.id, "")
-        else:
-            session = get_session()
-            try:
-                cell = session.query(TaskCell).filter_by(task_id=task.id, column_id=column.id).first()
-                return cell.value if cell else ""
-            finally:
-                session.close()
+        # Looked up in the cells loaded by the last refresh instead of querying
+        return self._cell_map.get((task.id, column.id), "")
     
     def create_cell(self, task, column, value):
         """Create a cell based on column type"""
@@ -277,18 +458,12 @@ class TaskTableView(ft.Container):
     
     def create_status_cell(self, task, column, value):
         """Create status cell with color"""
-        status_value = value or ""
-        status_color = STATUS_OPTIONS.get(status_value, ft.Colors.GREY_400)
-        
-        return ft.Container(
+        cell = ft.Container(
             content=ft.Container(
                 content=ft.Text(
-                    status_value or "Not set",
-                    color=ft.Colors.WHITE if status_value else ft.Colors.GREY_600,
                     size=12,
                     weight=ft.FontWeight.BOLD,
                 ),
-                bgcolor=status_color,
                 padding=ft.padding.symmetric(horizontal=15, vertical=8),
                 border_radius=15,
                 on_click=lambda e, t=task, c=column: self.cycle_status(t, c),
@@ -298,14 +473,30 @@ class TaskTableView(ft.Container):
             border=ft.border.all(1, ft.Colors.GREY_300),
             alignment=ft.Alignment(-1, 0),  # center_left
         )
+        self._style_status_cell(cell, value)
+        return cell
+    
+    def _style_status_cell(self, cell, value):
+        """Show a status value on a status cell"""
+        status_value = value or ""
+        badge = cell.content
+        if status_value in STATUS_OPTIONS:
+            badge.bgcolor = STATUS_OPTIONS[status_value]
+            badge.content.value = STATUS_LABELS[status_value]
+            badge.content.color = STATUS_TEXT_COLORS[status_value]
+        else:
+            # A value from outside the known set is shown as-is on grey
+            badge.bgcolor = ft.Colors.GREY_400
+            badge.content.value = status_value
+            badge.content.color = ft.Colors.WHITE
     
     def create_text_cell(self, task, column, value):
         """Create text input cell"""
         text_field = ft.TextField(
             value=value or "",
             border=ft.InputBorder.NONE,
-            on_submit=lambda e, t=task, c=column: self.update_cell(t, c, e.control.value),
-            on_blur=lambda e, t=task, c=column: self.update_cell(t, c, e.control.value),
+            on_submit=lambda e, t=task, c=column: self.queue_cell_update(t, c, e.control.value),
+            on_blur=lambda e, t=task, c=column: self.queue_cell_update(t, c, e.control.value),
             multiline=False,
         )
         
@@ -322,8 +513,8 @@ class TaskTableView(ft.Container):
             value=value or "",
             border=ft.InputBorder.NONE,
             hint_text="YYYY-MM-DD",
-            on_submit=lambda e, t=task, c=column: self.update_cell(t, c, e.control.value),
-            on_blur=lambda e, t=task, c=column: self.update_cell(t, c, e.control.value),
+            on_submit=lambda e, t=task, c=column: self.queue_cell_update(t, c, e.control.value),
+            on_blur=lambda e, t=task, c=column: self.queue_cell_update(t, c, e.control.value),
         )
         
         return ft.Container(
@@ -336,20 +527,14 @@ class TaskTableView(ft.Container):
     def cycle_status(self, task, column):
         """Cycle through status values"""
         current_value = self.get_cell_value(task, column)
-        status_list = list(STATUS_OPTIONS.keys())
-        
-        try:
-            current_index = status_list.index(current_value)
-            next_index = (current_index + 1) % len(status_list)
-        except ValueError:
-            next_index = 0
-        
-        new_value = status_list[next_index]
+        # An unknown value starts the cycle over at the first status
+        current_index = STATUS_INDEX.get(current_value, -1)
+        new_value = STATUS_KEYS[(current_index + 1) % len(STATUS_KEYS)]
         self.update_cell(task, column, new_value)
     
     def update_task_name(self, task, new_name):
-        """Update task name"""
-        if not new_name.strip():
+        """Update task name - blurring the field without editing it writes nothing"""
+        if not new_name.strip() or new_name == task.name:
             return
         
         if self.is_guest:
@@ -358,191 +543,341 @@ class TaskTableView(ft.Container):
                     guest_task.name = new_name
                     break
         else:
-            session = get_session()
-            try:
-                db_task = session.query(Task).filter_by(id=task.id).first()
-                if db_task:
-                    db_task.name = new_name
-                    session.commit()
-            except Exception as ex:
-                session.rollback()
-                show_snackbar(self.app_page, f"Error updating task: {str(ex)}", is_error=True)
-            finally:
-                session.close()
-        
-        self.refresh_table()
+            # Remember the new name for the check above without marking the task dirty -
+            # the write itself is a Core UPDATE on the writer thread
+            set_committed_value(task, "name", new_name)
+            task_id = task.id
+            self._queue_write(
+                lambda session: session.execute(
+                    update(Task).where(Task.id == task_id).values(name=new_name)
+                ),
+                "Error updating task",
+            )
+    
+    def queue_cell_update(self, task, column, value):
+        """Write a typed cell value after CELL_WRITE_DELAY, skipping values that didn't change"""
+        key = (task.id, column.id)
+        with self._pending_lock:
+            pending = self._pending_writes.pop(key, None)
+            if pending:
+                pending[0].cancel()
+            
+            if value == self.get_cell_value(task, column):
+                return
+            
+            if self.is_guest:
+                # Nothing to commit for guests - store it right away
+                self.update_cell(task, column, value)
+                return
+            
+            timer = threading.Timer(CELL_WRITE_DELAY, self._write_pending, args=(key,))
+            timer.daemon = True
+            self._pending_writes[key] = (timer, task, column, value)
+            timer.start()
+    
+    def _flush_pending_writes(self):
+        """Write all debounced cell values now instead of waiting for their timers"""
+        with self._pending_lock:
+            pending_writes = list(self._pending_writes.values())
+            self._pending_writes.clear()
+        for timer, task, column, value in pending_writes:
+            timer.cancel()
+            self.update_cell(task, column, value)
+    
+    def _discard_pending_writes(self, task_id=None, column_id=None):
+        """Cancel debounced writes to cells of a task or column that is being deleted, or all of them"""
+        discard_all = task_id is None and column_id is None
+        with self._pending_lock:
+            for key in [k for k in self._pending_writes if discard_all or k[0] == task_id or k[1] == column_id]:
+                self._pending_writes.pop(key)[0].cancel()
+    
+    def _write_pending(self, key):
+        """Write a debounced cell value whose delay has passed"""
+        with self._pending_lock:
+            pending = self._pending_writes.pop(key, None)
+        if pending:
+            _, task, column, value = pending
+            self.update_cell(task, column, value)
     
     def update_cell(self, task, column, value):
         """Update cell value"""
         if self.is_guest:
-            if task.id not in self.guest_cells:
-                self.guest_cells[task.id] = {}
-            self.guest_cells[task.id][column.id] = value
+            self.guest_cells[(task.id, column.id)] = value
         else:
-            session = get_session()
-            try:
-                cell = session.query(TaskCell).filter_by(task_id=task.id, column_id=column.id).first()
-                if cell:
-                    cell.value = value
-                else:
-                    cell = TaskCell(task_id=task.id, column_id=column.id, value=value)
-                    session.add(cell)
-                session.commit()
-            except Exception as ex:
-                session.rollback()
-                show_snackbar(self.app_page, f"Error updating cell: {str(ex)}", is_error=True)
-            finally:
-                session.close()
+            task_id, column_id = task.id, column.id
+            self._cell_map[(task_id, column_id)] = value
+            self._queue_write(
+                lambda session: self._write_cell(session, task_id, column_id, value),
+                "Error updating cell",
+            )
         
-        self.refresh_table()
+        # Text and date fields already show what was typed - only status badges redraw
+        if column.column_type == "status":
+            cell = self._cell_by_key.get((task.id, column.id))
+            if cell:
+                self._style_status_cell(cell, value)
+                cell.update()
+    
+    def _write_cell(self, session, task_id, column_id, value):
+        """Store a cell value - runs on the writer thread"""
+        # One upsert on the unique (task_id, column_id) index instead of a SELECT first
+        session.execute(
+            sqlite_insert(TaskCell)
+            .values(task_id=task_id, column_id=column_id, value=value)
+            .on_conflict_do_update(
+                index_elements=[TaskCell.task_id, TaskCell.column_id],
+                set_={"value": value},
+            )
+        )
     
     def add_task(self, e):
         """Add a new task"""
         if self.is_guest:
             self.guest_task_counter += 1
-            new_task = type('GuestTask', (), {
-                'id': self.guest_task_counter,
-                'name': f'New Task {self.guest_task_counter}',
-                'position': len(self.guest_tasks),
-                'board_id': self.board.id
-            })()
+            new_task = GuestTask(
+                id=self.guest_task_counter,
+                name=f'New Task {self.guest_task_counter}',
+                position=len(self.guest_tasks),
+                board_id=self.board.id,
+            )
             self.guest_tasks.append(new_task)
+            self._append_task_row(new_task)
             show_snackbar(self.app_page, "Task added! (Guest mode - not saved)")
         else:
-            session = get_session()
-            try:
-                task_count = session.query(Task).filter_by(board_id=self.board.id).count()
-                new_task = Task(
-                    board_id=self.board.id,
-                    name=f"New Task {task_count + 1}",
-                    position=task_count
-                )
-                session.add(new_task)
-                session.commit()
-                show_snackbar(self.app_page, "Task added!")
-            except Exception as ex:
-                session.rollback()
-                show_snackbar(self.app_page, f"Error adding task: {str(ex)}", is_error=True)
-            finally:
-                session.close()
-        
-        self.refresh_table()
+            position = self._next_task_pos
+            self._next_task_pos += 1
+            # The row needs the new task's id, so it is added once the insert is in
+            self._queue_write(
+                lambda session: self._insert_task(session, position),
+                "Error adding task",
+                on_done=self._task_added,
+            )
+    
+    def _insert_task(self, session, position):
+        """Insert a task at the given position - runs on the writer thread"""
+        new_task = Task(
+            board_id=self.board.id,
+            name=f"New Task {position + 1}",
+            position=position
+        )
+        session.add(new_task)
+        return new_task
+    
+    def _task_added(self, task):
+        """Show a task the writer thread has inserted"""
+        self._append_task_row(task)
+        show_snackbar(self.app_page, "Task added!")
+        self._tasks_changed()
+    
+    def _tasks_changed(self, _=None):
+        """Tell the owner the board's task count changed"""
+        if self.on_refresh:
+            self.on_refresh()
     
     def delete_task(self, task):
         """Delete a task"""
         if self.is_guest:
             self.guest_tasks = [t for t in self.guest_tasks if t.id != task.id]
-            if task.id in self.guest_cells:
-                del self.guest_cells[task.id]
+            # Its cells leave guest_cells along with the row
+            self._remove_task_row(task)
             show_snackbar(self.app_page, "Task deleted")
         else:
-            session = get_session()
-            try:
-                db_task = session.query(Task).filter_by(id=task.id).first()
-                if db_task:
-                    session.delete(db_task)
-                    session.commit()
-                    show_snackbar(self.app_page, "Task deleted")
-            except Exception as ex:
-                session.rollback()
-                show_snackbar(self.app_page, f"Error deleting task: {str(ex)}", is_error=True)
-            finally:
-                session.close()
-        
-        self.refresh_table()
+            self._discard_pending_writes(task_id=task.id)
+            self._remove_task_row(task)
+            show_snackbar(self.app_page, "Task deleted")
+            
+            task_id = task.id
+            self._queue_write(
+                lambda session: self._delete_row(session, Task, task_id),
+                "Error deleting task",
+                on_done=self._tasks_changed,
+            )
     
     def show_add_column_dialog(self, e):
         """Show dialog to add new column"""
-        column_name_field = ft.TextField(label="Column Name", autofocus=True, width=300)
-        column_type_dropdown = ft.Dropdown(
-            label="Column Type",
-            width=300,
-            options=[
-                ft.dropdown.Option("text", "Text"),
-                ft.dropdown.Option("status", "Status"),
-                ft.dropdown.Option("date", "Date"),
-            ],
-            value="text"
-        )
-        
-        def close_dialog(e):
-            dialog.open = False
+        self._column_name_field.value = ""
+        self._column_type_dropdown.value = "text"
+        self._add_column_dialog.open = True
+        if not self._dialog_attached:
+            self.app_page.overlay.append(self._add_column_dialog)
+            self._dialog_attached = True
             self.app_page.update()
+        else:
+            self.app_page.update(self._add_column_dialog)
+    
+    def _close_add_column_dialog(self, e=None):
+        """Close the add column dialog"""
+        self._add_column_dialog.open = False
+        self.app_page.update(self._add_column_dialog)
+    
+    def create_column(self, e):
+        """Add a column from the add column dialog"""
+        name = self._column_name_field.value
+        col_type = self._column_type_dropdown.value
         
-        def create_column(e):
-            name = column_name_field.value
-            col_type = column_type_dropdown.value
-            
-            if not name:
-                show_snackbar(self.app_page, "Column name is required", is_error=True)
-                return
+        if not name:
+            show_snackbar(self.app_page, "Column name is required", is_error=True)
+            return
+        
+        if self.is_guest:
+            self.guest_column_counter += 1
+            new_column = GuestColumn(
+                id=self.guest_column_counter,
+                name=name,
+                column_type=col_type,
+                position=len(self.guest_columns),
+            )
+            self.guest_columns.append(new_column)
+            show_snackbar(self.app_page, f"Column '{name}' added! (Guest mode)")
+        else:
+            # Columns are ordered by position, so the new one goes one past the last
+            position = self._columns[-1].position + 1 if self._columns else 0
             
-            if self.is_guest:
-                self.guest_column_counter += 1
-                new_column = type('GuestColumn', (), {
-                    'id': self.guest_column_counter,
-                    'name': name,
-                    'column_type': col_type,
-                    'position': len(self.guest_columns)
-                })()
-                self.guest_columns.append(new_column)
-                show_snackbar(self.app_page, f"Column '{name}' added! (Guest mode)")
-            else:
-                session = get_session()
-                try:
-                    col_count = session.query(BoardColumn).filter_by(board_id=self.board.id).count()
-                    new_column = BoardColumn(
-                        board_id=self.board.id,
-                        name=name,
-                        column_type=col_type,
-                        position=col_count
-                    )
-                    session.add(new_column)
-                    session.commit()
-                    show_snackbar(self.app_page, f"Column '{name}' added!")
-                except Exception as ex:
-                    session.rollback()
-                    show_snackbar(self.app_page, f"Error adding column: {str(ex)}", is_error=True)
-                finally:
-                    session.close()
+            def insert_column(session):
+                session.add(BoardColumn(
+                    board_id=self.board.id,
+                    name=name,
+                    column_type=col_type,
+                    position=position
+                ))
             
-            close_dialog(e)
-            self.refresh_table()
-        
-        dialog = ft.AlertDialog(
-            title=ft.Text("Add New Column"),
-            content=ft.Column([column_name_field, column_type_dropdown], tight=True),
-            actions=[
-                ft.TextButton("Cancel", on_click=close_dialog),
-                ft.ElevatedButton("Add", on_click=create_column),
-            ],
-        )
+            self._queue_write(
+                insert_column,
+                "Error adding column",
+                on_done=lambda _: show_snackbar(self.app_page, f"Column '{name}' added!"),
+            )
         
-        self.app_page.overlay.append(dialog)
-        dialog.open = True
-        self.app_page.update()
+        self._close_add_column_dialog()
+        self._refresh_after_writes()
     
     def delete_column(self, column):
         """Delete a column"""
         if self.is_guest:
             self.guest_columns = [c for c in self.guest_columns if c.id != column.id]
             # Remove cells for this column
-            for task_cells in self.guest_cells.values():
-                if column.id in task_cells:
-                    del task_cells[column.id]
+            for task in self.guest_tasks:
+                self.guest_cells.pop((task.id, column.id), None)
             show_snackbar(self.app_page, f"Column '{column.name}' deleted")
         else:
-            session = get_session()
+            self._discard_pending_writes(column_id=column.id)
+            column_id, column_name = column.id, column.name
+            self._queue_write(
+                lambda session: self._delete_row(session, BoardColumn, column_id),
+                "Error deleting column",
+                on_done=lambda _: show_snackbar(self.app_page, f"Column '{column_name}' deleted"),
+            )
+        
+        # Every row loses a cell - the whole table is redrawn once the delete is in
+        self._refresh_after_writes()
+    
+    def _delete_row(self, session, model, row_id):
+        """Delete a task or column; the database deletes its cells - runs on the writer thread"""
+        session.execute(delete(model).where(model.id == row_id))
+    
+    def _queue_write(self, write, error_message, on_done=None):
+        """Hand a write to the writer thread; on_done gets its result on the page's loop once it is committed"""
+        self._write_q.put((write, error_message, on_done))
+    
+    def _refresh_after_writes(self):
+        """Redraw the table from the database once every write queued so far is committed"""
+        if self.is_guest:
+            self.refresh_table()
+            return
+        
+        # Debounced edits go in first, or they'd be drawn with their old values
+        self._flush_pending_writes()
+        self._queue_write(lambda session: None, "Error refreshing table", on_done=lambda _: self.refresh_table())
+    
+    def _writer_loop(self):
+        """Run queued writes on the view's session, committing each burst of them together"""
+        while True:
+            jobs = [self._write_q.get()]
+            # Writes queued while the last batch ran (e.g. quick status clicks) share a commit
+            while True:
+                try:
+                    jobs.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            writes = [job for job in jobs if job is not None]
             try:
-                db_column = session.query(BoardColumn).filter_by(id=column.id).first()
-                if db_column:
-                    session.delete(db_column)
-                    session.commit()
-                    show_snackbar(self.app_page, f"Column '{column.name}' deleted")
-            except Exception as ex:
-                session.rollback()
-                show_snackbar(self.app_page, f"Error deleting column: {str(ex)}", is_error=True)
+                if writes:
+                    outcomes = self._run_writes(writes)
+                    # Controls are only changed on the page's event loop, never from here
+                    self.app_page.run_task(self._finish_writes, writes, outcomes)
+            except Exception:
+                # Keep the writer alive for later writes
+                logger.exception("Task table write failed")
             finally:
-                session.close()
+                for _ in jobs:
+                    self._write_q.task_done()
+            
+            if len(writes) < len(jobs):
+                return
+    
+    def _run_writes(self, writes):
+        """Run writes in one transaction, returning a (result, error) pair for each"""
+        with self._db_lock:
+            try:
+                results = [write(self._session) for write, _, _ in writes]
+                self._session.commit()
+                return [(result, None) for result in results]
+            except Exception as ex:
+                self._session.rollback()
+                if len(writes) == 1:
+                    return [(None, ex)]
         
-        self.refresh_table()
+        # Rolled back as a whole - run them one by one so only the failing write is lost
+        return [outcome for write in writes for outcome in self._run_writes([write])]
+    
+    async def _finish_writes(self, writes, outcomes):
+        """Report failed writes and run the completion callbacks of the rest - runs on the page's loop"""
+        failed = False
+        for (_, error_message, on_done), (result, error) in zip(writes, outcomes):
+            if error is not None and self._disposed:
+                # The view is gone - nothing left on screen to correct
+                logger.error("%s: %s", error_message, error)
+            elif error is not None:
+                show_snackbar(self.app_page, f"{error_message}: {str(error)}", is_error=True)
+                failed = True
+            elif self._disposed:
+                continue
+            elif on_done:
+                try:
+                    on_done(result)
+                except Exception:
+                    logger.exception("Task table write callback failed")
+        
+        if failed:
+            # Undo the optimistic changes on screen
+            self._refresh_after_writes()
+    
+    def dispose(self, flush=True):
+        """Close the view's database session and take its dialog off the page, writing unsaved edits first unless flush is False"""
+        self._disposed = True
+        if self._dialog_attached:
+            # Compared by identity - Flet controls compare equal field by field
+            overlay = self.app_page.overlay
+            overlay[:] = [c for c in overlay if c is not self._add_column_dialog]
+            self._dialog_attached = False
+        
+        if flush:
+            self._flush_pending_writes()
+        else:
+            self._discard_pending_writes()
+            while True:
+                try:
+                    self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                self._write_q.task_done()
+        
+        if self._writer_thread is not None:
+            self._write_q.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        
+        if self._session is not None:
+            with self._db_lock:
+                self._session.close()
+                self._session = None